@@ -0,0 +1,64 @@
+"""
+@file _kernels.py
+@brief Núcleos numéricos compilados com Numba
+@author Ana Beatriz Alves Hougaz
+@date 2025-10-12
+
+Este módulo importa o Numba e só é carregado por beverage_stock no
+primeiro uso de um cálculo que dependa dele, para que importar a
+biblioteca continue rápido e o Numba continue opcional.
+
+As fórmulas escalares também ficam aqui como funções @njit, para que
+outros núcleos compilados possam chamá-las; código Python comum deve
+usar as versões de beverage_stock, que aceitam qualquer tipo numérico.
+"""
+
+import math
+
+from numba import njit, prange
+
+
+@njit(cache=True)
+def _ss_float(desvio_padrao, dias_seguranca, demanda_media_diaria):
+    """
+    @brief Estoque de segurança sem arredondamento, para uso dentro de código @njit
+    @private
+    """
+    return desvio_padrao * dias_seguranca * demanda_media_diaria
+
+
+@njit(cache=True)
+def _rop_float(lead_time_dias, demanda_media_diaria, estoque_seguranca):
+    """
+    @brief Ponto de pedido sem arredondamento, para uso dentro de código @njit
+    @private
+    """
+    return (lead_time_dias * demanda_media_diaria) + estoque_seguranca
+
+
+@njit(cache=True)
+def _eoq_float(demanda_anual, custo_pedido, custo_manutencao):
+    """
+    @brief Lote econômico sem arredondamento, para uso dentro de código @njit
+    
+    @note O chamador garante custo_manutencao diferente de zero
+    @private
+    """
+    return math.sqrt((2 * demanda_anual * custo_pedido) / custo_manutencao)
+
+
+@njit(parallel=True, cache=True)
+def _eoq_batch(demanda_anual, custo_pedido, custo_manutencao, saida):
+    """
+    @brief Núcleo paralelo de CalculadoraCusto.calcular_lote_economico_batch_parallel
+    
+    Cada produto é independente, então o laço é dividido entre os núcleos
+    da CPU com prange. Os lotes são gravados sem arredondar em um array
+    float64; radicandos negativos viram NaN, e o chamador valida e
+    arredonda o resultado como a versão em lote.
+    
+    @note O chamador garante arrays 1-D do mesmo tamanho e custos de manutenção diferentes de zero
+    @private
+    """
+    for i in prange(demanda_anual.shape[0]):
+        saida[i] = _eoq_float(demanda_anual[i], custo_pedido[i], custo_manutencao[i])
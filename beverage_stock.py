@@ -5,20 +5,86 @@
 @date 2025-10-12
 """
 
-from enum import Enum
-from typing import List
+from enum import IntEnum
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import importlib.util
+import logging
 import math
 
+import numpy as np
 
-class TipoBebida(Enum):
+## @brief Logger das movimentações e alertas do estoque
+##
+## Os alertas usam WARNING e, sem configuração, o logging do Python já os
+## imprime no stderr. As movimentações usam INFO e só aparecem depois de
+## logging.basicConfig(level=logging.INFO).
+_log = logging.getLogger(__name__)
+
+## @brief Indica se o Numba está instalado (ele só é importado no primeiro uso)
+NUMBA_DISPONIVEL = importlib.util.find_spec("numba") is not None
+
+
+class TipoBebida(IntEnum):
     """
     @enum TipoBebida
     @brief Tipos de bebidas suportados pelo sistema
+    
+    Os valores são inteiros para que a coluna de tipos do Estoque seja
+    guardada como np.int8 e filtrada com comparações vetorizadas.
     """
     CERVEJA = 1  ##< Produtos do tipo cerveja
     REFRIGERANTE = 2  ##< Produtos do tipo refrigerante
 
 
+## @brief Dias de um ano comercial, usados para anualizar a demanda diária
+DIAS_ANO = 360
+
+## @brief Capacidade inicial da tabela de um Estoque
+_CAPACIDADE_INICIAL = 8
+
+## @brief Tamanho máximo do nome de um produto
+TAMANHO_MAXIMO_NOME = 64
+
+## @brief Layout de uma linha da tabela de produtos
+_DTYPE = np.dtype([
+    ('nome', f'U{TAMANHO_MAXIMO_NOME}'),
+    ('tipo', 'i1'),
+    ('custo_manutencao', 'f8'),
+    ('custo_manutencao_anual', 'f8'),
+    ('custo_pedido', 'f8'),
+    ('preco_unitario', 'f8'),
+    ('quantidade_estoque', 'i8'),
+])
+
+
+def _alocar_tabela(capacidade: int) -> np.recarray:
+    """
+    @brief Cria a tabela vazia que armazena os dados dos produtos
+    
+    Cada linha é um produto e cada campo do Produto é um campo do dtype
+    estruturado, de modo que tabela['quantidade_estoque'] (ou
+    tabela.quantidade_estoque) é uma coluna NumPy usada pelos cálculos
+    em lote sem percorrer objetos Python um a um.
+    
+    @param capacidade Número de linhas a reservar
+    @return Tabela zerada com dtype _DTYPE
+    @private
+    """
+    return np.zeros(capacidade, dtype=_DTYPE).view(np.recarray)
+
+
+def _colunas(tabela: np.recarray) -> Dict[str, np.ndarray]:
+    """
+    @brief Monta o dicionário campo -> coluna (visões da tabela)
+    
+    @param tabela Tabela criada por _alocar_tabela
+    @return Dicionário com uma visão por campo, sem cópia dos dados
+    @private
+    """
+    return {campo: tabela[campo] for campo in _DTYPE.names}
+
+
 class Produto:
     """
     @class Produto
@@ -26,8 +92,14 @@ class Produto:
     
     Essa classe é usada como base para todos os cálculos de estoque e pedido.
     Contém informações sobre custos logísticos e características do produto.
+    
+    Um Produto avulso guarda seus valores em listas Python de um elemento
+    (mesma interface campo -> coluna, sem custo de NumPy); ao ser adicionado
+    a um Estoque, passa a ser uma visão da sua linha nas colunas do Estoque.
     """
     
+    __slots__ = ('_cols', '_linha', '_estoque', '_str_cache')  ##< Sem __dict__: os campos vivem nas colunas
+    
     def __init__(self, nome: str, tipo: TipoBebida, custo_manutencao: float, 
                  custo_pedido: float, preco_unitario: float):
         """
@@ -38,34 +110,214 @@ class Produto:
         @param custo_manutencao Custo de manutenção por unidade/mês em BRL
         @param custo_pedido Custo fixo por pedido em BRL
         @param preco_unitario Preço de compra unitário em BRL
+        @throws ValueError Se o nome tiver mais de TAMANHO_MAXIMO_NOME caracteres
+        """
+        if len(nome) > TAMANHO_MAXIMO_NOME:
+            raise ValueError(f"Nome do produto excede {TAMANHO_MAXIMO_NOME} caracteres: '{nome}'")
+        
+        ## @brief Colunas onde os dados do produto estão guardados
+        self._cols = {
+            'nome': [nome],
+            'tipo': [TipoBebida(tipo)],
+            'custo_manutencao': [custo_manutencao],
+            'custo_manutencao_anual': [custo_manutencao * 12.0],
+            'custo_pedido': [custo_pedido],
+            'preco_unitario': [preco_unitario],
+            'quantidade_estoque': [0],
+        }
+        self._linha = 0  ##< Linha do produto nas colunas
+        self._estoque = None  ##< Estoque ao qual o produto foi adicionado, se houver
+        self._str_cache = None  ##< Par (quantidade, texto) da última chamada a __str__
+    
+    @property
+    def nome(self) -> str:
+        """
+        @brief Nome comercial do produto
+        
+        @note Somente leitura: o nome identifica o produto no índice do Estoque
+        """
+        return str(self._cols['nome'][self._linha])
+    
+    @property
+    def tipo(self) -> TipoBebida:
+        """
+        @brief Define se o produto é cerveja ou refrigerante
+        """
+        return TipoBebida(int(self._cols['tipo'][self._linha]))
+    
+    @tipo.setter
+    def tipo(self, valor: TipoBebida) -> None:
+        self._cols['tipo'][self._linha] = TipoBebida(valor)
+        self._str_cache = None
+    
+    @property
+    def custo_manutencao(self) -> float:
         """
-        self.nome = nome  ##< Nome comercial do produto
+        @brief Custo de Manutenção (Holding Cost) por unidade/mês (em BRL)
         
-        ## @brief Define se o produto é cerveja ou refrigerante
-        self.tipo = tipo
+        Inclui custos de refrigeração, armazenagem e seguro
+        """
+        return float(self._cols['custo_manutencao'][self._linha])
+    
+    @custo_manutencao.setter
+    def custo_manutencao(self, valor: float) -> None:
+        self._cols['custo_manutencao'][self._linha] = valor
+        self._cols['custo_manutencao_anual'][self._linha] = valor * 12.0
+    
+    @property
+    def custo_manutencao_anual(self) -> float:
+        """
+        @brief Custo de Manutenção por unidade/ano (em BRL)
+        
+        Calculado uma única vez sempre que custo_manutencao é alterado;
+        é a unidade esperada pelo cálculo do lote econômico.
+        """
+        return float(self._cols['custo_manutencao_anual'][self._linha])
+    
+    @property
+    def custo_pedido(self) -> float:
+        """
+        @brief Custo Fixo por Pedido (Ordering Cost) (em BRL)
         
-        ## @brief Custo de Manutenção (Holding Cost) por unidade/mês (em BRL)
-        ## 
-        ## Inclui custos de refrigeração, armazenagem e seguro
-        self.custo_manutencao = custo_manutencao
+        O custo logístico de fazer um novo pedido, independente da quantidade
+        """
+        return float(self._cols['custo_pedido'][self._linha])
+    
+    @custo_pedido.setter
+    def custo_pedido(self, valor: float) -> None:
+        self._cols['custo_pedido'][self._linha] = valor
+    
+    @property
+    def preco_unitario(self) -> float:
+        """
+        @brief Preço unitário de compra do produto
+        """
+        return float(self._cols['preco_unitario'][self._linha])
+    
+    @preco_unitario.setter
+    def preco_unitario(self, valor: float) -> None:
+        self._cols['preco_unitario'][self._linha] = valor
+    
+    @property
+    def quantidade_estoque(self) -> int:
+        """
+        @brief Quantidade atual em estoque
+        """
+        return int(self._cols['quantidade_estoque'][self._linha])
+    
+    @quantidade_estoque.setter
+    def quantidade_estoque(self, valor: int) -> None:
+        self._cols['quantidade_estoque'][self._linha] = valor
+    
+    def parametros_reposicao(self, demanda_media_diaria: float, lead_time_dias: int,
+                             desvio_padrao: float, dias_seguranca: int = 7) -> 'ParametrosReposicao':
+        """
+        @brief Calcula estoque de segurança, ponto de pedido e lote econômico do produto
         
-        ## @brief Custo Fixo por Pedido (Ordering Cost) (em BRL)
-        ##
-        ## O custo logístico de fazer um novo pedido, independente da quantidade
-        self.custo_pedido = custo_pedido
+        O resultado é memorizado pelas entradas (incluindo os custos atuais do
+        produto): chamadas repetidas com os mesmos valores não refazem as contas,
+        e alterar um custo gera automaticamente um novo cálculo.
         
-        ## @brief Preço unitário de compra do produto
-        self.preco_unitario = preco_unitario
+        @param demanda_media_diaria Consumo médio diário do produto
+        @param lead_time_dias O tempo de entrega do fornecedor em dias
+        @param desvio_padrao Variação na demanda ou no prazo de entrega
+        @param dias_seguranca Fator de serviço em dias
+        @return ParametrosReposicao com os três valores
+        """
+        return _parametros_reposicao(self.custo_pedido, self.custo_manutencao_anual,
+                                     demanda_media_diaria, lead_time_dias,
+                                     desvio_padrao, dias_seguranca)
+    
+    def _vincular(self, estoque: 'Estoque', linha: int) -> None:
+        """
+        @brief Copia os dados do produto para as colunas do Estoque e passa a apontar para elas
         
-        ## @brief Quantidade atual em estoque
-        self.quantidade_estoque = 0
+        @param estoque Estoque dono das colunas de destino
+        @param linha Linha reservada para o produto nas colunas do Estoque
+        @private
+        """
+        for campo, coluna in estoque._cols.items():
+            coluna[linha] = self._cols[campo][self._linha]
+        self._cols = estoque._cols
+        self._linha = linha
+        self._estoque = estoque
     
     def __str__(self) -> str:
         """
         @brief Representação em string do produto
+        
+        O texto é reaproveitado enquanto a quantidade em estoque não mudar
+        (nome é fixo e alterar o tipo descarta o texto guardado), então
+        relatórios repetidos só formatam os produtos movimentados.
+        
         @return String formatada com informações do produto
         """
-        return f"{self.nome} ({self.tipo.name}) - Estoque: {self.quantidade_estoque}"
+        quantidade = self.quantidade_estoque
+        if self._str_cache is None or self._str_cache[0] != quantidade:
+            self._str_cache = (quantidade, f"{self.nome} ({self.tipo.name}) - Estoque: {quantidade}")
+        return self._str_cache[1]
+
+
+def _ss_float(desvio_padrao, dias_seguranca, demanda_media_diaria):
+    """
+    @brief Fórmula do estoque de segurança, sem arredondar
+    
+    Usada quando uma fórmula alimenta outra (ex: estoque de segurança no
+    ponto de pedido): o arredondamento para unidades inteiras é feito uma
+    única vez, no resultado final.
+    @private
+    """
+    return desvio_padrao * dias_seguranca * demanda_media_diaria
+
+
+def _rop_float(lead_time_dias, demanda_media_diaria, estoque_seguranca):
+    """
+    @brief Fórmula do ponto de pedido, sem arredondar
+    @private
+    """
+    return (lead_time_dias * demanda_media_diaria) + estoque_seguranca
+
+
+def _eoq_float(demanda_anual, custo_pedido, custo_manutencao, raiz=math.sqrt):
+    """
+    @brief Fórmula do lote econômico, sem arredondar
+    
+    @param raiz Função de raiz quadrada; as versões em lote passam np.sqrt
+    @note O chamador garante custo_manutencao diferente de zero
+    @private
+    """
+    return raiz((2 * demanda_anual * custo_pedido) / custo_manutencao)
+
+
+def _arredondar_lote(valores: np.ndarray) -> np.ndarray:
+    """
+    @brief Arredonda para cima os resultados das fórmulas em lote
+    
+    NaN, infinito e valores fora do alcance de np.int64 seriam convertidos
+    silenciosamente em INT64_MIN por astype, então são rejeitados antes.
+    
+    @throws ValueError Se algum valor não couber em np.int64
+    @private
+    """
+    if not np.all(np.abs(valores) < 2.0 ** 63):
+        raise ValueError("Resultado não finito ou grande demais para um inteiro de 64 bits")
+    return np.ceil(valores).astype(np.int64)
+
+
+def _arredondar_eoq(eoq: np.ndarray) -> np.ndarray:
+    """
+    @brief Valida e arredonda os lotes econômicos das versões em lote e paralela
+    
+    Radicandos negativos ou NaN chegam aqui como NaN, já que np.sqrt e o
+    núcleo do Numba não levantam erro; assim as duas versões aceitam e
+    rejeitam exatamente as mesmas entradas.
+    
+    @throws ValueError Se algum lote for NaN ou não couber em np.int64
+    @private
+    """
+    if np.any(np.isnan(eoq)):
+        raise ValueError("math domain error")
+    return _arredondar_lote(eoq)
 
 
 class CalculadoraCusto:
@@ -92,12 +344,11 @@ class CalculadoraCusto:
         
         @note Um valor típico de dias_seguranca é 7 para produtos de alta rotação
         """
-        estoque_seguranca = desvio_padrao * dias_seguranca * demanda_media_diaria
-        return math.ceil(estoque_seguranca)
+        return math.ceil(_ss_float(desvio_padrao, dias_seguranca, demanda_media_diaria))
     
     @staticmethod
     def determinar_ponto_pedido(lead_time_dias: int, demanda_media_diaria: float, 
-                               estoque_seguranca: int) -> int:
+                               estoque_seguranca: float) -> int:
         """
         @brief Determina o Ponto de Pedido (Reorder Point - ROP)
         
@@ -106,13 +357,12 @@ class CalculadoraCusto:
         
         @param lead_time_dias O tempo de entrega do fornecedor em dias
         @param demanda_media_diaria O consumo médio diário do produto
-        @param estoque_seguranca O valor mínimo calculado
+        @param estoque_seguranca O valor mínimo calculado (pode ser fracionário)
         @return A quantidade total que deve acionar o novo pedido
         
         @warning Se o estoque atual cair abaixo deste valor, faça um pedido imediatamente!
         """
-        ponto_pedido = (lead_time_dias * demanda_media_diaria) + estoque_seguranca
-        return math.ceil(ponto_pedido)
+        return math.ceil(_rop_float(lead_time_dias, demanda_media_diaria, estoque_seguranca))
     
     @staticmethod
     def calcular_lote_economico(demanda_anual: float, custo_pedido: float, 
@@ -135,8 +385,233 @@ class CalculadoraCusto:
         if custo_manutencao == 0:
             raise ValueError("Custo de manutenção não pode ser zero")
         
-        eoq = math.sqrt((2 * demanda_anual * custo_pedido) / custo_manutencao)
-        return math.ceil(eoq)
+        return math.ceil(_eoq_float(demanda_anual, custo_pedido, custo_manutencao))
+
+    @staticmethod
+    def calcular_lote_economico_produto(produto: Produto, demanda_anual: float) -> int:
+        """
+        @brief Calcula o Lote Econômico de Compra diretamente a partir de um Produto
+        
+        Usa o custo de manutenção anual já calculado no produto, evitando
+        misturar custos mensais e anuais na chamada.
+        
+        @param produto Produto cujo lote será calculado
+        @param demanda_anual Demanda total prevista para o ano
+        @return A quantidade ótima a ser pedida
+        """
+        return CalculadoraCusto.calcular_lote_economico(
+            demanda_anual, produto.custo_pedido, produto.custo_manutencao_anual)
+    
+    @staticmethod
+    def calcular_estoque_seguranca_batch(desvio_padrao: np.ndarray, dias_seguranca: np.ndarray,
+                                         demanda_media_diaria: np.ndarray) -> np.ndarray:
+        """
+        @brief Versão vetorizada de calcular_estoque_seguranca
+        
+        Calcula o estoque de segurança de vários produtos em uma única operação NumPy.
+        
+        @param desvio_padrao Array com a variação na demanda de cada produto
+        @param dias_seguranca Array (ou escalar) com o fator de serviço em dias
+        @param demanda_media_diaria Array com o consumo médio diário de cada produto
+        @return Array de inteiros com o estoque de segurança de cada produto
+        @throws ValueError Se algum resultado for NaN, infinito ou não couber em np.int64
+        """
+        estoque_seguranca = _ss_float(np.asarray(desvio_padrao, dtype=np.float64),
+                                      np.asarray(dias_seguranca, dtype=np.float64),
+                                      np.asarray(demanda_media_diaria, dtype=np.float64))
+        return _arredondar_lote(estoque_seguranca)
+    
+    @staticmethod
+    def determinar_ponto_pedido_batch(lead_time_dias: np.ndarray, demanda_media_diaria: np.ndarray,
+                                      estoque_seguranca: np.ndarray) -> np.ndarray:
+        """
+        @brief Versão vetorizada de determinar_ponto_pedido
+        
+        @param lead_time_dias Array (ou escalar) com o tempo de entrega de cada produto
+        @param demanda_media_diaria Array com o consumo médio diário de cada produto
+        @param estoque_seguranca Array com o estoque de segurança de cada produto
+        @return Array de inteiros com o ponto de pedido de cada produto
+        @throws ValueError Se algum resultado for NaN, infinito ou não couber em np.int64
+        """
+        ponto_pedido = _rop_float(np.asarray(lead_time_dias, dtype=np.float64),
+                                  np.asarray(demanda_media_diaria, dtype=np.float64),
+                                  np.asarray(estoque_seguranca, dtype=np.float64))
+        return _arredondar_lote(ponto_pedido)
+    
+    @staticmethod
+    def calcular_lote_economico_batch(demanda_anual: np.ndarray, custo_pedido: np.ndarray,
+                                      custo_manutencao: np.ndarray) -> np.ndarray:
+        """
+        @brief Versão vetorizada de calcular_lote_economico
+        
+        Calcula o EOQ de todos os produtos de uma vez, evitando uma chamada
+        Python por produto em catálogos grandes.
+        
+        @param demanda_anual Array com a demanda anual de cada produto
+        @param custo_pedido Array com o custo fixo por pedido de cada produto
+        @param custo_manutencao Array com o custo anual de manutenção por unidade
+        @return Array de inteiros com a quantidade ótima de cada produto
+        @throws ValueError Se algum custo de manutenção for zero, se alguma
+                entrada levar a um radicando negativo ou NaN ou se algum
+                resultado for infinito
+        """
+        custo_manutencao = np.asarray(custo_manutencao, dtype=np.float64)
+        if np.any(custo_manutencao == 0):
+            raise ValueError("Custo de manutenção não pode ser zero")
+        
+        with np.errstate(invalid='ignore'):
+            eoq = _eoq_float(np.asarray(demanda_anual, dtype=np.float64),
+                             np.asarray(custo_pedido, dtype=np.float64),
+                             custo_manutencao, raiz=np.sqrt)
+        return _arredondar_eoq(eoq)
+    
+    @staticmethod
+    def calcular_lote_economico_batch_parallel(demanda_anual: np.ndarray, custo_pedido: np.ndarray,
+                                               custo_manutencao: np.ndarray) -> np.ndarray:
+        """
+        @brief Versão multinúcleo de calcular_lote_economico_batch
+        
+        Distribui os produtos entre os núcleos da CPU com um laço Numba
+        paralelo; vale a pena para catálogos com dezenas de milhares de
+        produtos. Sem o Numba instalado, ou se ele não puder ser importado,
+        usa calcular_lote_economico_batch.
+        
+        @param demanda_anual Array com a demanda anual de cada produto
+        @param custo_pedido Array com o custo fixo por pedido de cada produto
+        @param custo_manutencao Array com o custo anual de manutenção por unidade
+        @return Array de inteiros com a quantidade ótima de cada produto
+        @throws ValueError Nos mesmos casos que calcular_lote_economico_batch
+        """
+        if not NUMBA_DISPONIVEL:
+            return CalculadoraCusto.calcular_lote_economico_batch(
+                demanda_anual, custo_pedido, custo_manutencao)
+        
+        # Importado aqui para que só quem usa a versão paralela pague o custo do Numba.
+        # NUMBA_DISPONIVEL só diz que o pacote existe; uma instalação quebrada
+        # (ex: incompatível com o NumPy) também cai na versão em lote.
+        try:
+            from _kernels import _eoq_batch
+        except ImportError:
+            return CalculadoraCusto.calcular_lote_economico_batch(
+                demanda_anual, custo_pedido, custo_manutencao)
+        
+        entradas = np.broadcast_arrays(np.asarray(demanda_anual, dtype=np.float64),
+                                       np.asarray(custo_pedido, dtype=np.float64),
+                                       np.asarray(custo_manutencao, dtype=np.float64))
+        forma = entradas[0].shape
+        demanda, pedido, manutencao = (np.ravel(entrada) for entrada in entradas)
+        if np.any(manutencao == 0):
+            raise ValueError("Custo de manutenção não pode ser zero")
+        
+        eoq = np.empty(demanda.shape[0], dtype=np.float64)
+        _eoq_batch(demanda, pedido, manutencao, eoq)
+        return _arredondar_eoq(eoq.reshape(forma))
+    
+    @staticmethod
+    def simular_politica(produto: Produto, ponto_pedido: float, lote_economico: float,
+                         demanda_media_diaria: float, desvio_demanda_diaria: float,
+                         lead_time_dias: int, n_dias: int = DIAS_ANO,
+                         n_simulacoes: int = 1000,
+                         rng: Optional[np.random.Generator] = None) -> 'ResultadoSimulacao':
+        """
+        @brief Simula por Monte Carlo a política (ponto de pedido, lote econômico) de um produto
+        
+        Sorteia de uma vez a demanda diária (normal, truncada em zero) de
+        todos os dias e cenários e avança os n_simulacoes cenários em paralelo,
+        dia a dia, com operações NumPy. A cada dia a demanda é atendida com o
+        estoque em mãos (a falta é perdida) e, se a posição de estoque (em mãos
+        + em trânsito) estiver no ponto de pedido ou abaixo, um lote é pedido
+        e chega no início do dia lead_time_dias dias depois.
+        
+        @param produto Produto simulado (estoque inicial e custos)
+        @param ponto_pedido Posição de estoque que aciona um novo pedido
+        @param lote_economico Quantidade de cada pedido
+        @param demanda_media_diaria Média da demanda diária
+        @param desvio_demanda_diaria Desvio padrão da demanda diária, em unidades
+        @param lead_time_dias O tempo de entrega do fornecedor em dias (mínimo 1)
+        @param n_dias Horizonte simulado em dias
+        @param n_simulacoes Quantidade de cenários independentes
+        @param rng Gerador de números aleatórios (para resultados reprodutíveis)
+        @return ResultadoSimulacao com nível de serviço e custo total de cada cenário
+        @throws ValueError Se lead_time_dias for menor que 1
+        """
+        if lead_time_dias < 1:
+            raise ValueError("Lead time deve ser de pelo menos 1 dia")
+        rng = np.random.default_rng() if rng is None else rng
+        
+        demanda = np.maximum(
+            rng.normal(demanda_media_diaria, desvio_demanda_diaria, (n_dias, n_simulacoes)), 0.0)
+        chegadas = np.zeros((n_dias + lead_time_dias, n_simulacoes))
+        em_maos = np.full(n_simulacoes, float(produto.quantidade_estoque))
+        em_transito = np.zeros(n_simulacoes)
+        faltas = np.zeros(n_simulacoes)
+        estoque_acumulado = np.zeros(n_simulacoes)
+        pedidos = np.zeros(n_simulacoes, dtype=np.int64)
+        
+        for dia in range(n_dias):
+            em_maos += chegadas[dia]
+            em_transito -= chegadas[dia]
+            
+            atendido = np.minimum(demanda[dia], em_maos)
+            faltas += demanda[dia] - atendido
+            em_maos -= atendido
+            estoque_acumulado += em_maos
+            
+            pedir = (em_maos + em_transito) <= ponto_pedido
+            chegadas[dia + lead_time_dias] += pedir * lote_economico
+            em_transito += pedir * lote_economico
+            pedidos += pedir
+        
+        demanda_total = demanda.sum(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            nivel_servico = np.where(demanda_total > 0, 1.0 - faltas / demanda_total, 1.0)
+        
+        custo_manutencao_diario = produto.custo_manutencao_anual / DIAS_ANO
+        custo_total = pedidos * produto.custo_pedido + estoque_acumulado * custo_manutencao_diario
+        return ResultadoSimulacao(nivel_servico, custo_total)
+
+
+class ResultadoSimulacao(NamedTuple):
+    """
+    @class ResultadoSimulacao
+    @brief Resultado de CalculadoraCusto.simular_politica, com um valor por cenário
+    """
+    nivel_servico: np.ndarray  ##< Fração da demanda atendida em cada cenário
+    custo_total: np.ndarray  ##< Custo de pedidos + manutenção no horizonte simulado
+
+
+class ParametrosReposicao(NamedTuple):
+    """
+    @class ParametrosReposicao
+    @brief Parâmetros de reposição calculados para um produto
+    """
+    estoque_seguranca: int  ##< Quantidade mínima que deve estar sempre em estoque
+    ponto_pedido: int  ##< Quantidade que deve acionar o novo pedido
+    lote_economico: int  ##< Quantidade ótima a ser pedida
+
+
+@lru_cache(maxsize=4096)
+def _parametros_reposicao(custo_pedido: float, custo_manutencao_anual: float,
+                          demanda_media_diaria: float, lead_time_dias: int,
+                          desvio_padrao: float, dias_seguranca: int) -> ParametrosReposicao:
+    """
+    @brief Calcula (e memoriza) os parâmetros de reposição a partir das entradas
+    
+    @param custo_pedido Custo fixo por pedido
+    @param custo_manutencao_anual Custo de manutenção por unidade/ano
+    @param demanda_media_diaria Consumo médio diário do produto
+    @param lead_time_dias O tempo de entrega do fornecedor em dias
+    @param desvio_padrao Variação na demanda ou no prazo de entrega
+    @param dias_seguranca Fator de serviço em dias
+    @return ParametrosReposicao com os três valores
+    @private
+    """
+    estoque_seguranca = _ss_float(desvio_padrao, dias_seguranca, demanda_media_diaria)
+    ponto_pedido = _rop_float(lead_time_dias, demanda_media_diaria, estoque_seguranca)
+    lote_economico = CalculadoraCusto.calcular_lote_economico(
+        demanda_media_diaria * DIAS_ANO, custo_pedido, custo_manutencao_anual)
+    return ParametrosReposicao(math.ceil(estoque_seguranca), math.ceil(ponto_pedido),
+                               lote_economico)
 
 
 class Estoque:
@@ -157,16 +632,73 @@ class Estoque:
         @param nome_estoque Nome identificador do estoque
         """
         self.nome = nome_estoque  ##< Nome do estoque
-        self.produtos: List[Produto] = []  ##< Lista de produtos gerenciados
+        self._tabela = _alocar_tabela(_CAPACIDADE_INICIAL)  ##< Tabela (dtype estruturado) com os dados dos produtos
+        self._cols = _colunas(self._tabela)  ##< Visões das colunas da tabela, por campo
+        self._idx: Dict[str, int] = {}  ##< Índice nome -> linha nas colunas
+        self._size = 0  ##< Quantidade de linhas ocupadas nas colunas
+        self._produtos: List[Produto] = []  ##< Produtos gerenciados, na ordem de cadastro
         self.calculadora = CalculadoraCusto()  ##< Instância da calculadora de custos
     
+    @property
+    def produtos(self) -> Tuple[Produto, ...]:
+        """
+        @brief Produtos gerenciados, na ordem de cadastro
+        
+        É uma tupla somente leitura: novos produtos devem ser cadastrados
+        com adicionar_produto, que também os copia para as colunas.
+        """
+        return tuple(self._produtos)
+    
+    @property
+    def tabela(self) -> np.recarray:
+        """
+        @brief Visão somente leitura dos produtos cadastrados como recarray
+        
+        Permite acesso colunar (tabela.quantidade_estoque, tabela['tipo'])
+        sem cópia. Alterações devem passar pelos métodos do Estoque ou
+        pelos Produtos.
+        """
+        visao = self._tabela[:self._size]
+        visao.flags.writeable = False
+        return visao
+    
+    def __setstate__(self, estado: dict) -> None:
+        """
+        @brief Restaura o Estoque de um pickle
+        
+        O pickle guarda a tabela e as colunas como arrays independentes; as
+        colunas voltam a ser visões da tabela (atualizando no lugar o
+        dicionário compartilhado com os Produtos).
+        @private
+        """
+        self.__dict__.update(estado)
+        self._cols.update(_colunas(self._tabela))
+    
     def adicionar_produto(self, produto: Produto) -> None:
         """
         @brief Adiciona um novo produto ao estoque
+        
+        Os dados do produto são copiados para as colunas do estoque e a
+        instância passa a refletir as movimentações feitas pelo Estoque.
+        
         @param produto Instância de Produto a ser adicionada
+        @throws ValueError Se já existir um produto com o mesmo nome ou se o
+                produto já pertencer a um Estoque
         """
-        self.produtos.append(produto)
-        print(f"✓ Produto '{produto.nome}' adicionado ao estoque")
+        if produto._estoque is not None:
+            raise ValueError(f"Produto '{produto.nome}' já pertence ao estoque '{produto._estoque.nome}'")
+        if produto.nome in self._idx:
+            raise ValueError(f"Produto '{produto.nome}' já cadastrado")
+        
+        if self._size == len(self._tabela):
+            self._crescer()
+        
+        linha = self._size
+        produto._vincular(self, linha)
+        self._idx[produto.nome] = linha
+        self._produtos.append(produto)
+        self._size += 1
+        _log.info("✓ Produto '%s' adicionado ao estoque", produto.nome)
     
     def entrada_estoque(self, nome_produto: str, quantidade: int) -> None:
         """
@@ -174,12 +706,13 @@ class Estoque:
         
         @param nome_produto Nome do produto para identificação
         @param quantidade Quantidade de unidades que entraram
-        @throws ValueError Se o produto não for encontrado
+        @throws ValueError Se a quantidade não for inteira ou se o produto não for encontrado
         """
-        produto = self._buscar_produto(nome_produto)
-        if produto:
-            produto.quantidade_estoque += quantidade
-            print(f"✓ Entrada: +{quantidade} unidades de '{nome_produto}'")
+        quantidade = self._quantidade_inteira(quantidade)
+        linha = self._buscar_produto(nome_produto)
+        if linha is not None:
+            self._cols['quantidade_estoque'][linha] += quantidade
+            _log.info("✓ Entrada: +%d unidades de '%s'", quantidade, nome_produto)
         else:
             raise ValueError(f"Produto '{nome_produto}' não encontrado")
     
@@ -189,18 +722,62 @@ class Estoque:
         
         @param nome_produto Nome do produto para identificação
         @param quantidade Quantidade de unidades que saíram
-        @throws ValueError Se não houver estoque suficiente
+        @throws ValueError Se a quantidade não for inteira, se o produto não for
+                encontrado ou se não houver estoque suficiente
         """
-        produto = self._buscar_produto(nome_produto)
-        if produto:
-            if produto.quantidade_estoque >= quantidade:
-                produto.quantidade_estoque -= quantidade
-                print(f"✓ Saída: -{quantidade} unidades de '{nome_produto}'")
+        quantidade = self._quantidade_inteira(quantidade)
+        linha = self._buscar_produto(nome_produto)
+        if linha is not None:
+            disponivel = int(self._cols['quantidade_estoque'][linha])
+            if disponivel >= quantidade:
+                self._cols['quantidade_estoque'][linha] -= quantidade
+                _log.info("✓ Saída: -%d unidades de '%s'", quantidade, nome_produto)
             else:
-                raise ValueError(f"Estoque insuficiente! Disponível: {produto.quantidade_estoque}")
+                raise ValueError(f"Estoque insuficiente! Disponível: {disponivel}")
         else:
             raise ValueError(f"Produto '{nome_produto}' não encontrado")
     
+    def aplicar_movimentos(self, nomes: np.ndarray, deltas: np.ndarray) -> None:
+        """
+        @brief Aplica um lote de entradas e saídas de uma só vez
+        
+        Movimentos repetidos do mesmo produto são somados. O lote é tudo ou
+        nada: se algum produto ficar com estoque negativo, nada é gravado.
+        
+        @param nomes Nomes dos produtos movimentados (podem se repetir)
+        @param deltas Quantidades movimentadas: positivas para entrada, negativas para saída
+        @throws ValueError Se algum delta não for inteiro, se algum produto não
+                for encontrado ou se algum produto ficar com estoque negativo
+        """
+        nomes = np.asarray(nomes, dtype=object).ravel()
+        originais = np.asarray(deltas).ravel()
+        with np.errstate(invalid='ignore'):
+            deltas = originais.astype(np.int64)
+        if nomes.shape != deltas.shape:
+            raise ValueError("nomes e deltas devem ter o mesmo tamanho")
+        if np.any(deltas != originais):
+            raise ValueError("deltas devem ser quantidades inteiras")
+        
+        linhas = np.fromiter((self._idx.get(nome, -1) for nome in nomes),
+                             dtype=np.int64, count=len(nomes))
+        desconhecidos = nomes[linhas < 0]
+        if desconhecidos.size:
+            raise ValueError(f"Produto '{desconhecidos[0]}' não encontrado")
+        
+        acumulado = np.zeros(self._size, dtype=np.int64)
+        np.add.at(acumulado, linhas, deltas)
+        
+        quantidades = self._cols['quantidade_estoque'][:self._size]
+        resultado = quantidades + acumulado
+        negativos = np.flatnonzero(resultado < 0)
+        if negativos.size:
+            faltando = ", ".join(self._cols['nome'][negativos])
+            raise ValueError(f"Estoque insuficiente para: {faltando}")
+        
+        quantidades[:] = resultado
+        if _log.isEnabledFor(logging.INFO):
+            _log.info("✓ Movimentos: %d aplicados em %d produtos", len(deltas), np.unique(linhas).size)
+    
     def verificar_alertas(self, ponto_pedido: int, nome_produto: str) -> bool:
         """
         @brief Verifica se algum produto atingiu o ponto de pedido
@@ -209,13 +786,66 @@ class Estoque:
         @param nome_produto Nome do produto a verificar
         @return True se deve fazer pedido, False caso contrário
         """
-        produto = self._buscar_produto(nome_produto)
-        if produto:
-            if produto.quantidade_estoque <= ponto_pedido:
-                print(f"⚠️  ALERTA: '{nome_produto}' atingiu ponto de pedido!")
+        linha = self._buscar_produto(nome_produto)
+        if linha is not None:
+            if self._cols['quantidade_estoque'][linha] <= ponto_pedido:
+                _log.warning("⚠️  ALERTA: '%s' atingiu ponto de pedido!", nome_produto)
                 return True
         return False
     
+    def verificar_alertas_todos(self, pontos_pedido: np.ndarray,
+                                mascara: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        @brief Verifica de uma só vez quais produtos atingiram o ponto de pedido
+        
+        @param pontos_pedido Ponto de pedido de cada produto, na ordem de cadastro
+               (ou um único valor para todos)
+        @param mascara Array booleano opcional restringindo os produtos verificados
+        @return Array com os nomes dos produtos que devem ser pedidos
+        @throws ValueError Se pontos_pedido ou mascara não tiverem um valor por produto
+        """
+        pontos_pedido = np.asarray(pontos_pedido)
+        if pontos_pedido.ndim and pontos_pedido.shape != (self._size,):
+            raise ValueError(f"pontos_pedido deve ter um valor por produto ({self._size}), "
+                             f"recebido {pontos_pedido.size}")
+        
+        quantidades = self._cols['quantidade_estoque'][:self._size]
+        alerta = quantidades <= pontos_pedido
+        if mascara is not None:
+            mascara = np.asarray(mascara, dtype=bool)
+            if mascara.shape != (self._size,):
+                raise ValueError(f"mascara deve ter um valor por produto ({self._size}), "
+                                 f"recebido {mascara.size}")
+            alerta &= mascara
+        
+        nomes = self._cols['nome'][:self._size][alerta]
+        if nomes.size:
+            _log.warning("⚠️  ALERTA: atingiram ponto de pedido: %s",
+                         ", ".join(f"'{nome}'" for nome in nomes))
+        return nomes
+    
+    def filtrar_por_tipo(self, tipo: TipoBebida) -> np.ndarray:
+        """
+        @brief Lista os produtos de um tipo de bebida
+        
+        @param tipo Tipo desejado (CERVEJA ou REFRIGERANTE)
+        @return Array com os nomes dos produtos do tipo, na ordem de cadastro
+        """
+        mascara = self._cols['tipo'][:self._size] == tipo
+        return self._cols['nome'][:self._size][mascara]
+    
+    def custo_manutencao_por_tipo(self) -> Dict[TipoBebida, float]:
+        """
+        @brief Custo mensal de manutenção do estoque atual, agrupado por tipo de bebida
+        
+        @return Dicionário tipo -> soma de quantidade × custo de manutenção
+        """
+        tipos = self._cols['tipo'][:self._size]
+        custos = (self._cols['quantidade_estoque'][:self._size]
+                  * self._cols['custo_manutencao'][:self._size])
+        totais = np.bincount(tipos, weights=custos, minlength=max(TipoBebida) + 1)
+        return {tipo: float(totais[tipo]) for tipo in TipoBebida}
+    
     def relatorio_estoque(self) -> None:
         """
         @brief Gera relatório completo do estoque atual
@@ -226,25 +856,56 @@ class Estoque:
         print(f"RELATÓRIO DE ESTOQUE: {self.nome}")
         print(f"{'='*60}")
         
-        if not self.produtos:
+        if not self._size:
             print("Nenhum produto cadastrado.")
             return
         
-        for produto in self.produtos:
+        for produto in self._produtos:
             print(f"• {produto}")
         print(f"{'='*60}\n")
     
-    def _buscar_produto(self, nome: str) -> Produto:
+    def _buscar_produto(self, nome: str) -> Optional[int]:
         """
         @brief Método auxiliar para buscar produto por nome
         @param nome Nome do produto
-        @return Instância do Produto ou None
+        @return Linha do produto nas colunas ou None
+        @private
+        """
+        return self._idx.get(nome)
+    
+    @staticmethod
+    def _quantidade_inteira(quantidade: int) -> int:
+        """
+        @brief Converte uma quantidade movimentada para int, sem truncar
+        
+        Aplica às movimentações unitárias a mesma regra de aplicar_movimentos:
+        2.0 é aceito como 2, mas 2.9 é rejeitado em vez de virar 2.
+        
+        @param quantidade Quantidade informada
+        @return A quantidade como int
+        @throws ValueError Se a quantidade tiver parte fracionária ou não for finita
+        @private
+        """
+        try:
+            inteira = int(quantidade)
+        except (OverflowError, ValueError):
+            inteira = None
+        if inteira is None or inteira != quantidade:
+            raise ValueError("quantidade deve ser um número inteiro")
+        return inteira
+    
+    def _crescer(self) -> None:
+        """
+        @brief Dobra a capacidade da tabela, preservando as linhas ocupadas
+        
+        O dicionário de colunas é atualizado no lugar, então os Produtos
+        vinculados continuam enxergando os dados após o crescimento.
         @private
         """
-        for produto in self.produtos:
-            if produto.nome == nome:
-                return produto
-        return None
+        nova = _alocar_tabela(2 * len(self._tabela))
+        nova[:self._size] = self._tabela[:self._size]
+        self._tabela = nova
+        self._cols.update(_colunas(nova))
 
 
 # ============================================================================
@@ -258,6 +919,9 @@ if __name__ == "__main__":
     Demonstra a criação de produtos, cálculos logísticos e gestão de estoque
     """
     
+    # Exibir as mensagens de movimentação e alertas
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Criar produtos
     brahma = Produto(
         nome="Brahma Lata 350ml",
@@ -301,13 +965,26 @@ if __name__ == "__main__":
     )
     print(f"Ponto de Pedido: {ponto_pedido} unidades")
     
-    lote_economico = CalculadoraCusto.calcular_lote_economico(
-        demanda_anual=18000,
-        custo_pedido=brahma.custo_pedido,
-        custo_manutencao=brahma.custo_manutencao * 12
+    lote_economico = CalculadoraCusto.calcular_lote_economico_produto(
+        brahma,
+        demanda_anual=18000
     )
     print(f"Lote Econômico de Compra: {lote_economico} unidades")
     
+    # Avaliar a política em 1000 cenários de demanda de um ano
+    print("\n--- SIMULAÇÃO DA POLÍTICA (Monte Carlo) ---")
+    resultado = CalculadoraCusto.simular_politica(
+        brahma,
+        ponto_pedido=ponto_pedido,
+        lote_economico=lote_economico,
+        demanda_media_diaria=50,
+        desvio_demanda_diaria=10,
+        lead_time_dias=5,
+        rng=np.random.default_rng(42)
+    )
+    print(f"Nível de serviço médio: {resultado.nivel_servico.mean():.1%}")
+    print(f"Custo anual esperado: R$ {resultado.custo_total.mean():.2f}")
+    
     # Simular vendas
     print("\n--- SIMULAÇÃO DE VENDAS ---")
     estoque_principal.saida_estoque("Brahma Lata 350ml", 250)
@@ -0,0 +1,278 @@
+"""
+@file test_beverage_stock.py
+@brief Testes do armazenamento em colunas, das movimentações em lote e dos cálculos de EOQ
+
+Execute com: python -m unittest
+"""
+
+import pickle
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from beverage_stock import (NUMBA_DISPONIVEL, CalculadoraCusto, Estoque, Produto,
+                            TipoBebida, _CAPACIDADE_INICIAL, _parametros_reposicao)
+
+
+def _produto(nome: str, tipo: TipoBebida = TipoBebida.CERVEJA) -> Produto:
+    """
+    @brief Cria um produto com custos fixos para os testes
+    """
+    return Produto(nome, tipo, custo_manutencao=0.5, custo_pedido=150.0, preco_unitario=2.5)
+
+
+class TestArmazenamento(unittest.TestCase):
+    """
+    @brief Sincronia entre Produto e as colunas do Estoque
+    """
+
+    def test_produto_acompanha_estoque_apos_crescer(self):
+        estoque = Estoque()
+        produtos = [_produto(f"p{i}") for i in range(3 * _CAPACIDADE_INICIAL)]
+        for produto in produtos:
+            estoque.adicionar_produto(produto)
+
+        estoque.entrada_estoque("p0", 10)
+        produtos[-1].quantidade_estoque = 7
+
+        self.assertEqual(produtos[0].quantidade_estoque, 10)
+        self.assertEqual(estoque.tabela.quantidade_estoque[0], 10)
+        self.assertEqual(estoque.tabela.quantidade_estoque[-1], 7)
+        self.assertEqual(str(produtos[0]), "p0 (CERVEJA) - Estoque: 10")
+
+    def test_produto_de_outro_estoque_e_rejeitado(self):
+        a, b = Estoque("A"), Estoque("B")
+        produto = _produto("x")
+        a.adicionar_produto(produto)
+
+        with self.assertRaises(ValueError):
+            b.adicionar_produto(produto)
+        with self.assertRaises(ValueError):
+            a.adicionar_produto(_produto("x"))
+
+    def test_tipo_invalido_e_rejeitado(self):
+        produto = _produto("x")
+        with self.assertRaises(ValueError):
+            produto.tipo = 3
+        self.assertIs(produto.tipo, TipoBebida.CERVEJA)
+
+    def test_texto_guardado_ate_mudar_quantidade_ou_tipo(self):
+        estoque = Estoque()
+        produto = _produto("x")
+        estoque.adicionar_produto(produto)
+        texto = str(produto)
+
+        self.assertIs(str(produto), texto)
+        estoque.entrada_estoque("x", 4)
+        self.assertEqual(str(produto), "x (CERVEJA) - Estoque: 4")
+        produto.tipo = TipoBebida.REFRIGERANTE
+        self.assertEqual(str(produto), "x (REFRIGERANTE) - Estoque: 4")
+
+    def test_pickle_preserva_vinculo(self):
+        estoque = Estoque()
+        for i in range(_CAPACIDADE_INICIAL + 1):
+            estoque.adicionar_produto(_produto(f"p{i}"))
+        estoque.entrada_estoque("p1", 5)
+
+        copia = pickle.loads(pickle.dumps(estoque))
+        copia.entrada_estoque("p1", 3)
+        copia.adicionar_produto(_produto("novo"))
+
+        self.assertEqual(copia.produtos[1].quantidade_estoque, 8)
+        self.assertEqual(copia.tabela.quantidade_estoque[1], 8)
+        self.assertEqual(estoque.produtos[1].quantidade_estoque, 5)
+
+
+class TestMovimentos(unittest.TestCase):
+    """
+    @brief Movimentações em lote com aplicar_movimentos
+    """
+
+    def setUp(self):
+        self.estoque = Estoque()
+        for nome in ("a", "b", "c"):
+            self.estoque.adicionar_produto(_produto(nome))
+
+    def test_movimentos_repetidos_sao_somados(self):
+        self.estoque.aplicar_movimentos(["a", "b", "a", "c"], [10, 5, 3, 1])
+        np.testing.assert_array_equal(self.estoque.tabela.quantidade_estoque, [13, 5, 1])
+
+    def test_lote_invalido_nao_altera_estoque(self):
+        self.estoque.aplicar_movimentos(["a", "b"], [10, 5])
+
+        for nomes, deltas in ((["a", "b"], [-5, -6]),
+                              (["a", "z"], [1, 1]),
+                              (["a"], [1.7])):
+            with self.assertRaises(ValueError):
+                self.estoque.aplicar_movimentos(nomes, deltas)
+        np.testing.assert_array_equal(self.estoque.tabela.quantidade_estoque, [10, 5, 0])
+
+    def test_movimento_unitario_fracionario_e_rejeitado(self):
+        self.estoque.entrada_estoque("a", 3.0)
+        for quantidade in (2.9, float("nan"), float("inf")):
+            with self.assertRaises(ValueError):
+                self.estoque.entrada_estoque("a", quantidade)
+            with self.assertRaises(ValueError):
+                self.estoque.saida_estoque("a", quantidade)
+        self.assertEqual(self.estoque.produtos[0].quantidade_estoque, 3)
+
+    def test_produtos_e_somente_leitura(self):
+        with self.assertRaises(AttributeError):
+            self.estoque.produtos.append(_produto("d"))
+        self.assertEqual([p.nome for p in self.estoque.produtos], ["a", "b", "c"])
+
+    def test_alertas_com_tamanho_errado(self):
+        with self.assertRaises(ValueError):
+            self.estoque.verificar_alertas_todos([1, 2])
+
+
+class TestConsultasPorTipo(unittest.TestCase):
+    """
+    @brief Consultas vetorizadas por tipo de bebida
+    """
+
+    def setUp(self):
+        self.estoque = Estoque()
+        for nome, tipo in (("pilsen", TipoBebida.CERVEJA), ("cola", TipoBebida.REFRIGERANTE),
+                           ("ipa", TipoBebida.CERVEJA)):
+            self.estoque.adicionar_produto(_produto(nome, tipo))
+        self.estoque.aplicar_movimentos(["pilsen", "cola", "ipa"], [10, 4, 2])
+
+    def test_filtrar_por_tipo(self):
+        np.testing.assert_array_equal(self.estoque.filtrar_por_tipo(TipoBebida.CERVEJA),
+                                      ["pilsen", "ipa"])
+        np.testing.assert_array_equal(self.estoque.filtrar_por_tipo(TipoBebida.REFRIGERANTE),
+                                      ["cola"])
+
+    def test_custo_manutencao_por_tipo(self):
+        self.assertEqual(self.estoque.custo_manutencao_por_tipo(),
+                         {TipoBebida.CERVEJA: 6.0, TipoBebida.REFRIGERANTE: 2.0})
+        self.assertEqual(Estoque().custo_manutencao_por_tipo(),
+                         {TipoBebida.CERVEJA: 0.0, TipoBebida.REFRIGERANTE: 0.0})
+
+
+class TestLoteEconomico(unittest.TestCase):
+    """
+    @brief Concordância entre as versões escalar, em lote e paralela do EOQ
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.demanda = rng.uniform(100, 50000, 500)
+        self.pedido = rng.uniform(10, 300, 500)
+        self.manutencao = rng.uniform(0.5, 10, 500)
+
+    def test_versoes_concordam(self):
+        escalar = [CalculadoraCusto.calcular_lote_economico(d, k, h)
+                   for d, k, h in zip(self.demanda, self.pedido, self.manutencao)]
+        lote = CalculadoraCusto.calcular_lote_economico_batch(
+            self.demanda, self.pedido, self.manutencao)
+        paralelo = CalculadoraCusto.calcular_lote_economico_batch_parallel(
+            self.demanda, self.pedido, self.manutencao)
+
+        np.testing.assert_array_equal(lote, escalar)
+        np.testing.assert_array_equal(paralelo, escalar)
+
+    def test_sinais_negativos_concordam(self):
+        metodos = (CalculadoraCusto.calcular_lote_economico_batch,
+                   CalculadoraCusto.calcular_lote_economico_batch_parallel)
+        self.assertEqual(CalculadoraCusto.calcular_lote_economico(-100.0, -150.0, 6.0), 71)
+        for metodo in metodos:
+            np.testing.assert_array_equal(metodo([-100.0], [-150.0], [6.0]), [71])
+
+    def test_paralelo_sem_numba_importavel(self):
+        with mock.patch.dict(sys.modules, {"_kernels": None}), \
+                mock.patch("beverage_stock.NUMBA_DISPONIVEL", True):
+            paralelo = CalculadoraCusto.calcular_lote_economico_batch_parallel(
+                self.demanda, self.pedido, self.manutencao)
+        lote = CalculadoraCusto.calcular_lote_economico_batch(
+            self.demanda, self.pedido, self.manutencao)
+        np.testing.assert_array_equal(paralelo, lote)
+
+    def test_exemplo_do_readme(self):
+        self.assertEqual(CalculadoraCusto.calcular_lote_economico(18000, 150, 6.0), 949)
+
+    def test_entradas_invalidas_em_lote(self):
+        metodos = [CalculadoraCusto.calcular_lote_economico_batch]
+        if NUMBA_DISPONIVEL:
+            metodos.append(CalculadoraCusto.calcular_lote_economico_batch_parallel)
+        for metodo in metodos:
+            for demanda in ([-1.0], [np.nan], [np.inf]):
+                with self.assertRaises(ValueError):
+                    metodo(demanda, [150.0], [6.0])
+
+    def test_resultados_nao_finitos_em_lote(self):
+        for invalido in (np.nan, np.inf, 1e300):
+            with self.assertRaises(ValueError):
+                CalculadoraCusto.calcular_estoque_seguranca_batch([invalido], [7], [10.0])
+            with self.assertRaises(ValueError):
+                CalculadoraCusto.determinar_ponto_pedido_batch([3], [10.0], [invalido])
+
+
+class TestParametrosReposicao(unittest.TestCase):
+    """
+    @brief Memorização de Produto.parametros_reposicao
+    """
+
+    def setUp(self):
+        _parametros_reposicao.cache_clear()
+        self.produto = _produto("x")
+
+    def test_chamada_repetida_usa_cache(self):
+        primeiro = self.produto.parametros_reposicao(50.0, 3, 0.2)
+        segundo = self.produto.parametros_reposicao(50.0, 3, 0.2)
+
+        self.assertIs(segundo, primeiro)
+        self.assertEqual(_parametros_reposicao.cache_info().hits, 1)
+        self.assertEqual(tuple(primeiro), (70, 220, 949))
+
+    def test_alterar_custo_recalcula(self):
+        antes = self.produto.parametros_reposicao(50.0, 3, 0.2)
+        self.produto.custo_pedido = 600.0
+        depois = self.produto.parametros_reposicao(50.0, 3, 0.2)
+
+        self.assertEqual(_parametros_reposicao.cache_info().misses, 2)
+        self.assertEqual(antes.lote_economico, 949)
+        self.assertEqual(depois.lote_economico, 1898)
+
+
+class TestSimulacao(unittest.TestCase):
+    """
+    @brief Simulação da política de reposição com demanda determinística
+    
+    Com desvio zero a demanda é sempre 10 por dia, então pedidos, chegadas
+    e custos podem ser conferidos à mão.
+    """
+
+    def setUp(self):
+        self.produto = _produto("x")
+        self.produto.quantidade_estoque = 100
+
+    def _simular(self, lead_time_dias: int, n_dias: int):
+        return CalculadoraCusto.simular_politica(
+            self.produto, ponto_pedido=50, lote_economico=100, demanda_media_diaria=10.0,
+            desvio_demanda_diaria=0.0, lead_time_dias=lead_time_dias, n_dias=n_dias,
+            n_simulacoes=4, rng=np.random.default_rng(0))
+
+    def test_estoque_suficiente(self):
+        # Pedido no dia 4 (posição 50), chegada no dia 7; estoque em mãos
+        # ao fim de cada dia: 90..30, 120, 110, 100 -> 750 unidades-dia
+        resultado = self._simular(lead_time_dias=3, n_dias=10)
+        np.testing.assert_array_equal(resultado.nivel_servico, np.ones(4))
+        np.testing.assert_allclose(resultado.custo_total, 150.0 + 750 * 6.0 / 360)
+
+    def test_chegada_apos_lead_time(self):
+        # Pedido no dia 4 chega no dia 11: o estoque zera no dia 9 e só a
+        # demanda do dia 10 é perdida
+        resultado = self._simular(lead_time_dias=7, n_dias=12)
+        np.testing.assert_allclose(resultado.nivel_servico, 1.0 - 10 / 120)
+
+    def test_lead_time_invalido(self):
+        with self.assertRaises(ValueError):
+            self._simular(lead_time_dias=0, n_dias=10)
+
+
+if __name__ == "__main__":
+    unittest.main()